@@ -1,11 +1,16 @@
 import sqlalchemy as sa
-from .utils import SimpleTimer
-import pprint, re
+from .utils import SimpleTimer, ThreadLocalStdout
+import hashlib, io, json, queue, re, sys, threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from collections.abc import Sequence
 
+# Optionally schema-qualified table name, e.g. 'myschema.mytable' or 'mytable'
+_NAME_RE = re.compile(r'^(?:(?P<schema>\w+)\.)?(?P<table>\w+)$')
+
+
 @dataclass
-class _Bucket: 
+class _Bucket:
     '''A bucket class to keep track of everything involved with comparing two tables
     in potentially separate databases'''
     t1name: str
@@ -19,103 +24,385 @@ class _Bucket:
     table1: sa.Table
     table2: sa.Table
     table1_in_engine2: sa.Table = field(init=False) # Added later
-    drop_cols: list[str]
-
-
-def _create_table1_in_engine2(b: _Bucket) -> sa.Table: 
-    '''Create table1 as a TEMP table in engine2 database'''
-    l = []
-    for col in b.table2.c:
-        if col.name not in b.drop_cols:
-            l.append(sa.Column(col.name, col.type))
-    table1_in_engine2 = sa.Table(f'{b.table1}_table1_in_engine2',
-                                 b.metadata2, *l, prefixes=['TEMPORARY'])
-    table1_in_engine2.create(bind=b.engine2)
+    drop_cols: frozenset[str]
+    kept_cols: tuple[sa.Column, ...] = field(init=False) # Added later
+
+    def __post_init__(self):
+        self.kept_cols = tuple(
+            col for col in self.table2.c if col.name.lower() not in self.drop_cols)
+
+
+def _reflect_tables(engine: sa.Engine, metadata: sa.MetaData, names: list[str]):
+    '''Reflect all requested tables from `engine` up front, one schema-info
+    round-trip per schema instead of one autoload round-trip per table'''
+    by_schema = {}
+    for name in names:
+        m = _NAME_RE.match(name)
+        by_schema.setdefault(m['schema'], set()).add(m['table'])
+    for schema, only in by_schema.items():
+        try:
+            # views=True keeps views comparable, as per-table autoload was
+            metadata.reflect(bind=engine, schema=schema, only=sorted(only), views=True)
+        except sa.exc.InvalidRequestError as e:
+            print(f'\nTable(s) not found in {engine.url}: {e}\n')
+            raise e
+
+
+def _is_memory_sqlite(engine: sa.Engine) -> bool:
+    '''Whether `engine` is an in-memory sqlite database, which exists per
+    connection and cannot be shared across pool worker threads'''
+    return (engine.dialect.name == 'sqlite'
+            and engine.url.database in (None, ':memory:'))
+
+
+def _load_table(metadata: sa.MetaData, name: str) -> sa.Table:
+    '''Look up an optionally schema-qualified table reflected by _reflect_tables'''
+    m = _NAME_RE.match(name)
+    key = f'{m["schema"]}.{m["table"]}' if m['schema'] else m['table']
+    return metadata.tables[key]
+
+
+def _cache_table_name(b: _Bucket, cache_key: str) -> str:
+    '''Deterministic name for a cached copy of table1 in engine2. The digest
+    covers the full identity of the comparison - the schema-qualified source
+    table, the target table, and the kept columns in order - so equally named
+    sources in different schemas, the same source compared against several
+    targets, or a change to the ignored columns or the target's shape each
+    resolve to their own cache table instead of colliding or being reused
+    with the wrong columns'''
+    ident = '|'.join([str(b.table1), b.t2name, *[col.name for col in b.kept_cols]])
+    digest = hashlib.md5(ident.encode()).hexdigest()[:8]
+    return f'__qadiff_{cache_key}_{b.table1.name}_{digest}'
+
+
+def _check_table_cache(b: _Bucket, conn1: sa.Connection, conn2: sa.Connection,
+                       cache_key: str, trust_cache_counts: bool):
+    '''Look for a previously cached copy of table1 in engine2
+
+    When the cached table exists and still matches the source, set it as
+    b.table1_in_engine2 and return `(row_count, hash_checked)` so the
+    transfer can be skipped. Freshness means matching hash fingerprints when
+    both engines share a dialect that has one; otherwise only the row counts
+    can be compared, which misses in-place UPDATEs, so the cache is treated
+    as stale unless the caller passed trust_cache_counts. A stale cache table
+    is dropped; returns None when a fresh transfer is needed.'''
+    name = _cache_table_name(b, cache_key)
+    if not sa.inspect(conn2).has_table(name):
+        return None
+    cached = sa.Table(name, sa.MetaData(),
+                      *[sa.Column(col.name, col.type) for col in b.kept_cols])
+    hash_func = _HASH_FUNCS.get(b.engine1.dialect.name)
+    can_hash = (hash_func is not None
+                and b.engine1.dialect.name == b.engine2.dialect.name)
+    if not can_hash and not trust_cache_counts:
+        cached.drop(bind=conn2)
+        return None
+    nrows_cached = conn2.execute(
+        sa.select(sa.func.count()).select_from(cached)).scalar_one()
+    nrows_source = conn1.execute(
+        sa.select(sa.func.count()).select_from(b.table1)).scalar_one()
+    fresh = nrows_cached == nrows_source
+    if fresh and can_hash:
+        cols1 = [b.table1.c[col.name] for col in b.kept_cols]
+        fresh = (_fingerprint(conn1, cols1, hash_func)
+                 == _fingerprint(conn2, list(cached.c), hash_func))
+    if not fresh:
+        cached.drop(bind=conn2)
+        return None
+    b.table1_in_engine2 = cached
+    return nrows_cached, can_hash
+
+
+def _create_table1_in_engine2(b: _Bucket, conn2: sa.Connection,
+                              cache_key: str = None) -> sa.Table:
+    '''Create table1 as a TEMP table in engine2 database, or as a persistent
+    cache table when `cache_key` is given
+
+    Created on `conn2` since TEMP tables are scoped to their session. The
+    table gets its own MetaData: workers run concurrently and Table
+    registration mutates the shared collection'''
+    l = [sa.Column(col.name, col.type) for col in b.kept_cols]
+    if cache_key is not None:
+        # UNLOGGED skips WAL on postgresql; other dialects get a plain table
+        prefixes = ['UNLOGGED'] if b.engine2.dialect.name == 'postgresql' else []
+        name = _cache_table_name(b, cache_key)
+    else:
+        prefixes = ['TEMPORARY']
+        name = f'{b.table1}_table1_in_engine2'
+    table1_in_engine2 = sa.Table(name, sa.MetaData(), *l, prefixes=prefixes)
+    table1_in_engine2.create(bind=conn2)
     return table1_in_engine2
 
 
-def _copy_table1_to_engine2(b: _Bucket, conn1: sa.Connection, conn2: sa.Connection):
-    '''Batch INSERT data from table1 in engine1 to the temp table in engine2'''
-    n = 15000
+# Per-dialect functions for a cheap per-row integer hash
+_HASH_FUNCS = {
+    'postgresql': 'hashtext',
+    'oracle': 'ora_hash',
+    'mysql': 'crc32',
+    'mariadb': 'crc32',
+    }
+
+
+def _fingerprint(conn: sa.Connection, cols: list[sa.Column], hash_func: str) -> tuple:
+    '''Compute a cheap digest of a table: (row count, sum of per-row hashes)'''
+    if conn.dialect.name in ('mysql', 'mariadb'):
+        # MySQL rejects row constructors inside CAST (error 1241), and
+        # serializing the row with CONCAT_WS is unsound: it skips NULLs and
+        # values containing the separator collide. Hash each column
+        # separately instead - CRC32 of NULL is NULL, and 2**32 lies outside
+        # CRC32's range, so NULL hashes distinctly from every real value -
+        # and weight by position so column order stays significant
+        row_hash = sum(
+            sa.func.ifnull(sa.func.crc32(sa.cast(col, sa.Text)), 2 ** 32) * (i + 1)
+            for i, col in enumerate(cols))
+    else:
+        row_hash = getattr(sa.func, hash_func)(sa.cast(sa.tuple_(*cols), sa.Text))
+    return tuple(conn.execute(sa.select(sa.func.count(), sa.func.sum(row_hash))).one())
+
+
+def _fingerprints_match(b: _Bucket, conn1: sa.Connection, conn2: sa.Connection) -> bool:
+    '''Check whether the two tables have identical digests, in which case the
+    transfer and comparison can be skipped entirely
+
+    Only meaningful when both engines speak the same dialect - the hash
+    functions differ between providers - and only when that dialect has a
+    suitable hash function. Returns False whenever a skip cannot be proven safe.'''
+    if b.engine1.dialect.name != b.engine2.dialect.name:
+        return False
+    hash_func = _HASH_FUNCS.get(b.engine1.dialect.name)
+    if hash_func is None:
+        return False
+    try:
+        cols1 = [b.table1.c[col.name] for col in b.kept_cols]
+    except KeyError:
+        return False
+    return (_fingerprint(conn1, cols1, hash_func)
+            == _fingerprint(conn2, list(b.kept_cols), hash_func))
+
+
+def _iter_partitions_threaded(result: sa.CursorResult):
+    '''Yield partitions fetched by a background producer thread, so the next
+    read from engine1 overlaps the current write to engine2
+
+    The queue is bounded so memory stays at a few partitions regardless of
+    table size. Only the producer touches the result's connection. If the
+    consumer stops early (e.g. the INSERT raises), the producer is signalled
+    to stop and joined before this generator exits, so the connection is
+    never rolled back while another thread is still using it.'''
+    q = queue.Queue(maxsize=2)
+    stop = threading.Event()
+
+    def _put(item):
+        '''Block until the consumer takes the item or tells us to stop'''
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def producer():
+        try:
+            for partition in result.partitions():
+                if not _put(partition):
+                    return
+            _put(None)
+        except BaseException as e:
+            _put(e)
+
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+    try:
+        while (partition := q.get()) is not None:
+            if isinstance(partition, BaseException):
+                raise partition
+            yield partition
+    finally:
+        stop.set()
+        # Drain so a producer blocked on a full queue sees the stop event
+        while True:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                break
+        thread.join()
+
+
+# Default transfer batch sizes per target dialect. The sweet spot differs by
+# engine: postgresql plateaus around 10k rows per batch while mysql and duckdb
+# keep improving well past it
+_DEFAULT_BATCH = {
+    'postgresql': 10000,
+    'mysql': 50000,
+    'mariadb': 50000,
+    'duckdb': 100000,
+    'oracle': 10000,
+    'sqlite': 5000,
+    }
+
+
+def _copy_table1_to_engine2(b: _Bucket, conn1: sa.Connection, conn2: sa.Connection,
+                            batch_size: int = None):
+    '''Bulk load data from table1 in engine1 to the temp table in engine2
+
+    Uses the fastest ingest path the engine2 driver offers: COPY FROM STDIN
+    for postgresql (psycopg), fast_executemany for pyodbc, and SQLAlchemy's
+    executemany otherwise (which mysql drivers rewrite into multi-row INSERTs).
+    When `batch_size` is None the batch defaults to the target dialect's
+    sweet spot from _DEFAULT_BATCH.
+
+    Returns the number of rows transferred, sparing callers a COUNT(*) scan
+    of the temp table'''
+    n = (batch_size if batch_size is not None
+         else _DEFAULT_BATCH.get(b.engine2.dialect.name, 10000))
     rows_inserted = 0
     print(f'\n{"*" * 80}')
     print(f'Transferring {b.t1name} from {b.host1} to TEMP table in {b.host2}')
-    stmt = sa.select(sa.func.count()).select_from(b.table1)
-    result = conn1.execute(stmt)
-    row_count = result.scalar_one_or_none()
 
-    conn1.execution_options(yield_per=n)
-    stmt = sa.select(b.table1)
+    # stream_results makes the driver use a server-side cursor instead of
+    # buffering the whole table client-side
+    conn1 = conn1.execution_options(yield_per=n, stream_results=True)
+    # Select only the kept columns, in temp-table order, so positional ingest
+    # lines up and dropped columns never cross the network
+    stmt = sa.select(*[b.table1.c[col.name] for col in b.table1_in_engine2.c])
     result = conn1.execute(stmt)
-    for partition in result.mappings().partitions():
+    # An in-memory sqlite connection refuses cross-thread use, so read
+    # inline instead of through the producer thread
+    if _is_memory_sqlite(b.engine1):
+        partitions = result.partitions()
+    else:
+        partitions = _iter_partitions_threaded(result)
+    dialect = b.engine2.dialect
+    if dialect.name == 'postgresql' and dialect.driver == 'psycopg':
+        preparer = dialect.identifier_preparer
+        col_list = ', '.join(preparer.format_column(col) for col in b.table1_in_engine2.c)
+        copy_stmt = f'COPY {preparer.format_table(b.table1_in_engine2)} ({col_list}) FROM STDIN'
+        cursor = conn2.connection.driver_connection.cursor()
+        with cursor.copy(copy_stmt) as cp:
+            # Rows go straight from the streamed partition into the COPY
+            # buffer, which psycopg flushes to the socket in large chunks -
+            # no intermediate tuples or dicts are built per row
+            for partition in partitions:
+                for row in partition:
+                    cp.write_row(row)
+                rows_inserted = rows_inserted + len(partition)
+                print(f'... transferred {rows_inserted:,d} rows')
+    elif dialect.driver == 'pyodbc':
+        insert_stmt = str(sa.insert(b.table1_in_engine2).compile(dialect=dialect))
+        cursor = conn2.connection.driver_connection.cursor()
+        cursor.fast_executemany = True
+        for partition in partitions:
+            cursor.executemany(insert_stmt, [tuple(row) for row in partition])
+            rows_inserted = rows_inserted + len(partition)
+            print(f'... transferred {rows_inserted:,d} rows')
+    else:
+        # executemany needs dicts, but zipping the key tuple once per row is
+        # cheaper than materializing a RowMapping for every row
+        keys = result.keys()
         stmt2 = sa.insert(b.table1_in_engine2)
-        conn2.execute(stmt2, partition)
-        rows_inserted = rows_inserted + len(partition)
-        print(f'... transferred {rows_inserted:,d} of {row_count:,d} - {rows_inserted / row_count:.1%}')
-    print()
+        for partition in partitions:
+            conn2.execute(stmt2, [dict(zip(keys, row)) for row in partition])
+            rows_inserted = rows_inserted + len(partition)
+            print(f'... transferred {rows_inserted:,d} rows')
+    print(f'... transferred {rows_inserted:,d} rows in total\n')
+    return rows_inserted
 
 
-def _create_drop_cols(ignore_all: list[str], ignore_cols: dict, entry: str) -> list[str]: 
-    '''Create the columns to ignore from all tables and 
+def _create_drop_cols(ignore_all: list[str], ignore_cols: dict, entry: str) -> frozenset[str]:
+    '''Create the columns to ignore from all tables and
     the columns to ignore from this specific table'''
-    drop_cols = [l.lower() for l in ignore_all]
-    extend_cols = []
-    if isinstance(entry, str): 
+    drop_cols = {l.lower() for l in ignore_all}
+    if isinstance(entry, str):
         entry = [entry]
-    for k, v in ignore_cols.items(): 
-        for table in entry: 
-            if k == table: 
-                if isinstance(v, list) or isinstance(v, tuple): 
-                    extend_cols.extend(v)
-                else: 
-                    extend_cols.append(v)
-    drop_cols.extend(extend_cols)
-    return drop_cols
-
-
-def _compare_tables(b: _Bucket, conn2: sa.Connection): 
-    '''Compare the two tables now in engine2 with SQL EXCEPT'''
-    table_2_cols = [col for col in b.table2.c if col.name not in b.drop_cols]
-
-    stmt_appear = sa.select(
-        *table_2_cols).except_(sa.select(b.table1_in_engine2))
-    table1_in_engine2_nrows = conn2.execute(
-        sa.select(sa.func.count()).select_from(b.table1_in_engine2)).scalar_one()
-    rv_appear = conn2.execute(stmt_appear)
-    appear = rv_appear.mappings().fetchmany(5)
-    
-    stmt_disappear = (sa.select(b.table1_in_engine2).except_(
-        sa.select(*table_2_cols)))
-    table2_nrows = conn2.execute(
-        sa.select(sa.func.count()).select_from(b.table2)).scalar_one()
-    rv_disappear = conn2.execute(stmt_disappear)
-    disappear = rv_disappear.mappings().fetchmany(5)
-
-    print(f'{b.t2name}: {max(rv_appear.rowcount, 0):,d} newly appear in {b.host2} ({max(rv_appear.rowcount / max(table2_nrows, 1), 0) :.1%} of {table2_nrows:,d} rows)')
-    if rv_appear.rowcount > 0: 
-        for row in appear: 
-            pprint.pprint(dict(row), sort_dicts=False)
+    for table in entry:
+        v = ignore_cols.get(table)
+        if v:
+            drop_cols.update([v.lower()] if isinstance(v, str)
+                             else (l.lower() for l in v))
+    return frozenset(drop_cols)
+
+
+def _compare_tables(b: _Bucket, conn2: sa.Connection, table1_in_engine2_nrows: int = None):
+    '''Compare the two tables now in engine2 with SQL NOT EXISTS anti-joins
+
+    Anti-joins avoid the global de-duplicating sort that EXCEPT forces on both
+    inputs. IS NOT DISTINCT FROM keeps EXCEPT's treatment of NULLs as equal.
+    Diff totals come from a COUNT(*) OVER () window attached to each probe
+    rather than from cursor rowcount, which many DBAPIs report as -1 for
+    SELECTs. `table1_in_engine2_nrows` is the row total already known from
+    the transfer, so the temp table is never re-scanned; pass None when there
+    was no transfer (same-database comparison) and it is counted here instead.'''
+    t1_cols = [b.table1_in_engine2.c[col.name] for col in b.kept_cols]
+    match_rows = sa.and_(*[
+        c1.is_not_distinct_from(c2) for c1, c2 in zip(t1_cols, b.kept_cols)])
+    total = sa.func.count().over().label('__total')
+
+    # LIMIT on the server keeps millions of diff rows off the wire; the
+    # window total is computed before the LIMIT applies, so one pass yields
+    # both the full count and the 5 sample rows
+    stmt_appear = sa.select(*b.kept_cols, total).where(
+        ~sa.exists().where(match_rows)).limit(5)
+    stmt_disappear = sa.select(*t1_cols, total).where(
+        ~sa.exists().where(match_rows)).limit(5)
+
+    if table1_in_engine2_nrows is None:
+        table1_in_engine2_nrows, table2_nrows = conn2.execute(sa.select(
+            sa.select(sa.func.count()).select_from(b.table1_in_engine2).scalar_subquery(),
+            sa.select(sa.func.count()).select_from(b.table2).scalar_subquery())).one()
+    else:
+        table2_nrows = conn2.execute(
+            sa.select(sa.func.count()).select_from(b.table2)).scalar_one()
+    appear = conn2.execute(stmt_appear).mappings().all()
+    n_appear = appear[0]['__total'] if appear else 0
+
+    disappear = conn2.execute(stmt_disappear).mappings().all()
+    n_disappear = disappear[0]['__total'] if disappear else 0
+
+    print(f'{b.t2name}: {n_appear:,d} newly appear in {b.host2} ({n_appear / max(table2_nrows, 1) :.1%} of {table2_nrows:,d} rows)')
+    for row in appear:
+        d = dict(row)
+        del d['__total']
+        print(json.dumps(d, default=str, indent=2))
     print()
-    print(f'{b.t1name}: {max(rv_disappear.rowcount, 0):,d} disappear from {b.host1} ({max(rv_disappear.rowcount / max(table1_in_engine2_nrows, 1), 0) :.1%} of {table1_in_engine2_nrows:,d} rows)')
-    if rv_disappear.rowcount > 0: 
-        for row in disappear: 
-            pprint.pprint(dict(row), sort_dicts=False)
+    print(f'{b.t1name}: {n_disappear:,d} disappear from {b.host1} ({n_disappear / max(table1_in_engine2_nrows, 1) :.1%} of {table1_in_engine2_nrows:,d} rows)')
+    for row in disappear:
+        d = dict(row)
+        del d['__total']
+        print(json.dumps(d, default=str, indent=2))
 
 
-def recorddiff(engine1: sa.Engine, engine2: sa.Engine, 
-               *tables: str | tuple[str, str], 
-               ignore_all: list[str] = [], ignore_cols: dict[str, str | list[str]] = {}): 
+def recorddiff(engine1: sa.Engine, engine2: sa.Engine,
+               *tables: str | tuple[str, str],
+               ignore_all: list[str] = [], ignore_cols: dict[str, str | list[str]] = {},
+               batch_size: int = None, cache_key: str = None,
+               trust_cache_counts: bool = False):
     '''Compare rows between similarly named tables in two different databases
-    
+
     Does not account for indices, primary keys, or other table artifacts
     - `engine1`: SQLAlchemy Engine
     - `engine2`: SQLAlchemy Engine (must not be Oracle)
-    - `tables`: Names of tables to compare. They can take the form of 
-        - `'table1', 'table2', ...` if the tables have the same names, or 
+    - `tables`: Names of tables to compare. They can take the form of
+        - `'table1', 'table2', ...` if the tables have the same names, or
         - `[('engine1_table1', 'engine2_table1'), ('engine1_table2', 'engine2_table2'), ...]` if the tables have different names between databases
     - `ignore_all`: List of columns to ignore across all tables in comparison
     - `ignore_cols`: Dict of `{table: [list of columns]}` to ignore only in a specific table
-    
+    - `batch_size`: Rows transferred per batch. Defaults to the engine2
+        dialect's sweet spot (e.g. 10,000 for postgresql, 50,000 for mysql)
+    - `cache_key`: When set, the copy of each table1 is kept in engine2 as a
+        persistent table (UNLOGGED on postgresql) named from this key, and
+        re-runs skip the transfer while the cached copy still matches the
+        source. Freshness is verified with hash fingerprints, which requires
+        both engines to share a dialect that has one (postgresql, oracle,
+        mysql/mariadb); otherwise the cache is re-transferred every run
+        unless `trust_cache_counts` is set. Useful when tweaking
+        ignore_all/ignore_cols against large reference tables; the cache
+        tables must be cleaned up by the caller
+    - `trust_cache_counts`: Accept a matching row count as proof of cache
+        freshness when hash fingerprints are unavailable (e.g. Oracle to
+        postgresql). In-place UPDATEs on the source do not change the row
+        count, so only set this when the source is append-only or immutable
+
     It is advised to put the older database first, i.e. if you are comparing an
     older Oracle database and a modern postgresql database, then `engine1` should be 
     Oracle while `engine2` should be postgresql. This package will make a table in 
@@ -124,53 +411,108 @@ def recorddiff(engine1: sa.Engine, engine2: sa.Engine,
     if engine2.name == 'oracle': 
         raise NotImplementedError("Oracle does not support temporary tables per session before Oracle 18c. Please use a different database provider for engine2, or submit a pull request with manager's approval.")
     timer = SimpleTimer()
-    metadata1 = sa.MetaData()
-    metadata2 = sa.MetaData()
     assert isinstance(ignore_all, list), "ignore_all is not a list!"
     assert isinstance(ignore_cols, dict), "ignore_cols is not a dict!"
 
-    for entry in tables: 
-        timer.start_lap()
-        if isinstance(entry, str): 
+    local_stdout = ThreadLocalStdout(sys.stdout)
+    print_lock = threading.Lock()
+
+    parsed = []
+    for entry in tables:
+        if isinstance(entry, str):
             t1name = entry
             t2name = entry
-        elif isinstance(entry, Sequence): 
+        elif isinstance(entry, Sequence):
             assert len(entry) == 2
             t1name, t2name = entry[0], entry[1]
-        else: 
+        else:
             raise TypeError(f'Type of {entry} ({type(entry)}) not accepted. Must be str or sequence with length 2.')
+        parsed.append((entry, t1name, t2name))
 
-        regex_pattern = '^(?:(?P<schema>\w+)\.)?(?P<table>\w+)$'
-        try: 
-            m1 = re.match(regex_pattern, t1name)
-            schema_extract1 = m1['schema']
-            table_extract1 = m1['table']
-            table1 = sa.Table(table_extract1, metadata1, schema=schema_extract1, autoload_with=engine1)
+    # Reflect every requested table once up front; the workers then look the
+    # Table objects up without issuing any schema-info queries of their own
+    metadata1 = sa.MetaData()
+    metadata2 = sa.MetaData()
+    _reflect_tables(engine1, metadata1, [t1name for _, t1name, _ in parsed])
+    _reflect_tables(engine2, metadata2, [t2name for _, _, t2name in parsed])
+
+    def _process_one(item):
+        '''Run the full create/copy/compare pipeline for one table entry,
+        buffering output so concurrent workers' log lines do not interleave'''
+        entry, t1name, t2name = item
+        buffer = io.StringIO()
+        local_stdout.register(buffer)
+        lap_timer = SimpleTimer()
+        try:
+            lap_timer.start_lap()
+            table1 = _load_table(metadata1, t1name)
+            table2 = _load_table(metadata2, t2name)
             host1 = engine1.url.host
-        except sa.exc.NoSuchTableError as e: 
-            print(f'\nTable "{t1name}" not found in {engine1.url}\n')
-            raise e
-        try: 
-            m2 = re.match(regex_pattern, t2name)
-            schema_extract2 = m2['schema']
-            table_extract2 = m2['table']
-            table2 = sa.Table(table_extract2, metadata2, schema=schema_extract2, autoload_with=engine2)
             host2 = engine2.url.host
-        except sa.exc.NoSuchTableError as e: 
-            print(f'\nTable {t2name} not found in {engine2.url}\n')
-            raise e
 
-        drop_cols = _create_drop_cols(ignore_all, ignore_cols, entry)
+            drop_cols = _create_drop_cols(ignore_all, ignore_cols, entry)
+
+            b = _Bucket(t1name, t2name, metadata1, metadata2, host1, host2, engine1, engine2,
+                    table1, table2, drop_cols)
+            # To see what b looks like now, use pprint.pprint(b)
+
+            # When both engines point at the same database, the tables can be
+            # compared in place - the whole create/copy pipeline is skipped.
+            # Driver and port must match too (one host can run several
+            # instances), and in-memory databases never count: each
+            # sqlite:// engine is its own private database
+            same_db = (engine1.url.database is not None
+                       and engine1.url.database != ':memory:'
+                       and (engine1.url.drivername, engine1.url.host,
+                            engine1.url.port, engine1.url.database)
+                       == (engine2.url.drivername, engine2.url.host,
+                           engine2.url.port, engine2.url.database))
 
-        b = _Bucket(t1name, t2name, metadata1, metadata2, host1, host2, engine1, engine2, 
-                   table1, table2, drop_cols)
-        b.table1_in_engine2 = _create_table1_in_engine2(b)
-        # To see what b looks like now, use pprint.pprint(b)
+            with engine1.begin() as conn1, engine2.begin() as conn2:
+                if _fingerprints_match(b, conn1, conn2):
+                    print(f'\n{"*" * 80}')
+                    print(f'{b.t1name}: fingerprints match between {b.host1} and {b.host2} - skipping transfer and comparison\n')
+                elif same_db:
+                    b.table1_in_engine2 = b.table1
+                    print(f'\n{"*" * 80}')
+                    print(f'{b.t1name} and {b.t2name} are in the same database - comparing in place without transfer')
+                    _compare_tables(b, conn2)
+                else:
+                    cache_hit = None
+                    if cache_key is not None:
+                        cache_hit = _check_table_cache(b, conn1, conn2, cache_key,
+                                                       trust_cache_counts)
+                    if cache_hit is not None:
+                        rows_cached, hash_checked = cache_hit
+                        print(f'\n{"*" * 80}')
+                        print(f'{b.t1name}: cached copy in {b.host2} still matches {b.host1} - skipping transfer')
+                        if not hash_checked:
+                            print(f'WARNING: freshness verified by row count only (trust_cache_counts=True); in-place UPDATEs on {b.t1name} are not detected')
+                        _compare_tables(b, conn2, rows_cached)
+                    else:
+                        b.table1_in_engine2 = _create_table1_in_engine2(b, conn2, cache_key)
+                        rows_inserted = _copy_table1_to_engine2(b, conn1, conn2, batch_size)
+                        _compare_tables(b, conn2, rows_inserted)
 
-        with engine1.begin() as conn1, engine2.begin() as conn2: 
-            _copy_table1_to_engine2(b, conn1, conn2)
-            _compare_tables(b, conn2)
+            lap_timer.end_lap()
+        finally:
+            local_stdout.deregister()
+            with print_lock:
+                local_stdout.wrapped.write(buffer.getvalue())
+                local_stdout.wrapped.flush()
 
-        timer.end_lap()
-    
+    if tables:
+        sys.stdout = local_stdout
+        try:
+            if _is_memory_sqlite(engine1) or _is_memory_sqlite(engine2):
+                # An in-memory sqlite database is only visible from the
+                # thread/connection that created it, so pool workers would
+                # each see a fresh empty database
+                for item in parsed:
+                    _process_one(item)
+            else:
+                with ThreadPoolExecutor(max_workers=min(len(parsed), 8)) as ex:
+                    list(ex.map(_process_one, parsed))
+        finally:
+            sys.stdout = local_stdout.wrapped
     timer.end()
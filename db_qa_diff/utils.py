@@ -1,4 +1,4 @@
-import sqlalchemy as sa, time
+import sqlalchemy as sa, threading, time
 
 def print_stmt(stmt: sa.sql, rowcount = None): 
     '''Print out an SQLAlchemy statement'''
@@ -16,6 +16,41 @@ def print_petl(nrows: int, table):
         print(f'\t--')
 
 
+class ThreadLocalStdout():
+    '''A stdout wrapper that routes writes to a per-thread buffer when one is
+    registered, and passes through to the wrapped stream otherwise
+    ```
+    local_stdout = ThreadLocalStdout(sys.stdout)
+    sys.stdout = local_stdout
+    # in each worker thread:
+    local_stdout.register(buffer)
+    # run code that prints
+    local_stdout.deregister()
+    ```
+    '''
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+        self._local = threading.local()
+
+    def register(self, buffer):
+        '''Send this thread's writes to `buffer`'''
+        self._local.buffer = buffer
+
+    def deregister(self):
+        '''Send this thread's writes back to the wrapped stream'''
+        self._local.buffer = None
+
+    def _target(self):
+        buffer = getattr(self._local, 'buffer', None)
+        return buffer if buffer is not None else self.wrapped
+
+    def write(self, s):
+        return self._target().write(s)
+
+    def flush(self):
+        return self._target().flush()
+
+
 class SimpleTimer():
     '''A simple timer, with ability to measure a "lap"
     ```
@@ -31,39 +66,35 @@ class SimpleTimer():
     one_hour = one_minute * 60
     one_day = one_hour * 24
 
-    def __init__(self): 
-        self._start = time.time()
+    def __init__(self):
+        self._start = time.monotonic()
         self._lap_start = None
 
     def _format_elapsed(self, elapsed):
-        days = elapsed // self.one_day
-        remainder = elapsed - (days * self.one_day)
-        hours = remainder // self.one_hour
-        remainder = remainder - (hours * self.one_hour)
-        minutes = remainder // self.one_minute
-        remainder = remainder - (minutes * self.one_minute)
-        seconds = remainder % self.one_minute
-        
-        if days > 0: 
-            return f'{days:.0f} day(s), {hours:.0f} hour(s), {minutes:.0f} minute(s), and {seconds:.0f} second(s)'
-        elif hours > 0: 
-            return f'{hours:.0f} hour(s), {minutes:.0f} minute(s), and {seconds:.0f} second(s)'
-        elif minutes > 0: 
-            return f'{minutes:.0f} minute(s) and {seconds:.0f} second(s)'
+        days, remainder = divmod(int(elapsed), self.one_day)
+        hours, remainder = divmod(remainder, self.one_hour)
+        minutes, seconds = divmod(remainder, self.one_minute)
+
+        if days > 0:
+            return f'{days} day(s), {hours} hour(s), {minutes} minute(s), and {seconds} second(s)'
+        elif hours > 0:
+            return f'{hours} hour(s), {minutes} minute(s), and {seconds} second(s)'
+        elif minutes > 0:
+            return f'{minutes} minute(s) and {seconds} second(s)'
         else:
-            return f'{seconds:.0f} second(s)'
+            return f'{seconds} second(s)'
 
-    def start_lap(self): 
+    def start_lap(self):
         '''Begin recording a new "lap"'''
-        self._lap_start = time.time()
+        self._lap_start = time.monotonic()
 
-    def end_lap(self): 
+    def end_lap(self):
         '''Calculate elapsed time of most recent lap'''
         assert self._lap_start != None, "SimpleTimer lap ended before being started"
-        elapsed = time.time() - self._lap_start
+        elapsed = time.monotonic() - self._lap_start
         print(f'Lap elapsed time: {self._format_elapsed(elapsed)}')
-    
-    def end(self): 
+
+    def end(self):
         '''Calculate elapsed time of timer'''
-        elapsed = time.time() - self._start
+        elapsed = time.monotonic() - self._start
         print(f'Timer elapsed time: {self._format_elapsed(elapsed)}')